@@ -199,9 +199,9 @@ class Names:
     def get_name(self, name_attr: str, space_attr: Optional[str]) -> Optional["NamedSchema"]:
         """Fetch the stored schema for the given namespace."""
         test = Name(name_attr, space_attr, self.default_namespace).fullname
-        if test not in self.names:
+        if test is None:
             return None
-        return self.names[test]
+        return self.names.get(test)
 
     def add_name(
         self, name_attr: str, space_attr: Optional[str], new_schema: "NamedSchema"
@@ -300,8 +300,11 @@ class Field:
         self._has_default = has_default
         self._props.update(other_props or {})
 
-        if isinstance(atype, str) and names is not None and names.has_name(atype, None):
-            type_schema: Schema = cast(NamedSchema, names.get_name(atype, None))
+        known_schema = (
+            names.get_name(atype, None) if isinstance(atype, str) and names is not None else None
+        )
+        if known_schema is not None:
+            type_schema: Schema = known_schema
         else:
             try:
                 type_schema = make_avsc_object(atype, names)
@@ -408,8 +411,9 @@ class ArraySchema(Schema):
 
         if names is None:
             raise SchemaParseException("Must provide Names.")
-        if isinstance(items, str) and names.has_name(items, None):
-            items_schema = cast(Schema, names.get_name(items, None))
+        known_schema = names.get_name(items, None) if isinstance(items, str) else None
+        if known_schema is not None:
+            items_schema: Schema = known_schema
         else:
             try:
                 items_schema = make_avsc_object(items, names)
@@ -442,8 +446,9 @@ class MapSchema(Schema):
         Schema.__init__(self, "map", other_props)
 
         # Add class members
-        if isinstance(values, str) and names.has_name(values, None):
-            values_schema = cast(Schema, names.get_name(values, None))
+        known_schema = names.get_name(values, None) if isinstance(values, str) else None
+        if known_schema is not None:
+            values_schema: Schema = known_schema
         else:
             try:
                 values_schema = make_avsc_object(values, names)
@@ -481,8 +486,9 @@ class NamedMapSchema(NamedSchema):
         NamedSchema.__init__(self, "map", name, namespace, names, other_props)
 
         # Add class members
-        if isinstance(values, str) and names.has_name(values, None):
-            values_schema = cast(Schema, names.get_name(values, None))
+        known_schema = names.get_name(values, None) if isinstance(values, str) else None
+        if known_schema is not None:
+            values_schema: Schema = known_schema
         else:
             try:
                 values_schema = make_avsc_object(values, names)
@@ -508,8 +514,9 @@ class NamedMapSchema(NamedSchema):
 def _build_schema_objects(schemas: List[JsonDataType], names: Names) -> List[Schema]:
     schema_objects: List[Schema] = []
     for schema in schemas:
-        if isinstance(schema, str) and names.has_name(schema, None):
-            new_schema = cast(Schema, names.get_name(schema, None))
+        known_schema = names.get_name(schema, None) if isinstance(schema, str) else None
+        if known_schema is not None:
+            new_schema: Schema = known_schema
         else:
             try:
                 new_schema = make_avsc_object(schema, names)
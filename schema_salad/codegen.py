@@ -28,6 +28,7 @@ from .typescript_codegen import TypeScriptCodeGen
 from .utils import aslist
 
 FIELD_SORT_ORDER = ["id", "class", "name"]
+_FIELD_SORT_RANK = {name: rank for rank, name in enumerate(FIELD_SORT_ORDER)}
 
 
 def codegen(
@@ -159,11 +160,7 @@ def codegen(
 
             sorted_fields = sorted(
                 rec.get("fields", []),
-                key=lambda i: (
-                    FIELD_SORT_ORDER.index(i["name"].split("/")[-1])
-                    if i["name"].split("/")[-1] in FIELD_SORT_ORDER
-                    else 100
-                ),
+                key=lambda i: _FIELD_SORT_RANK.get(i["name"].split("/")[-1], 100),
             )
 
             for field in sorted_fields:
@@ -29,14 +29,8 @@ from .schema import shortname
 from .utils import aslist
 
 
-def q(s: str) -> str:
-    """Put quotes around a string."""
-    return '"' + s + '"'
-
-
-def replaceKeywords(s: str) -> str:
-    """Rename keywords that are reserved in C++."""
-    if s in (
+_RESERVED_WORDS = frozenset(
+    {
         "class",
         "enum",
         "int",
@@ -48,14 +42,63 @@ def replaceKeywords(s: str) -> str:
         "stdout",
         "stderr",
         "union",
-    ):
+    }
+)
+
+_UNSAFE_CHARS_RE = re.compile("[^a-zA-Z0-9]")
+
+_SALAD_NAMESPACE = "https://w3id.org/cwl/salad#"
+
+_PRIMITIVE_TYPE_NAMES = frozenset({"null", "boolean", "int", "long", "float", "double", "string"})
+
+# Schema type names, each with its short and fully qualified spelling
+_TYPE_NAME_SPELLINGS = {
+    name: frozenset({name, f"{_SALAD_NAMESPACE}{name}"})
+    for name in ("record", "enum", "array", "map", "union")
+}
+
+# Schema Salad primitive type names, short and fully qualified, to C++ types
+_PRIMITIVE_TYPES = {
+    "null": "std::monostate",
+    f"{_SALAD_NAMESPACE}null": "std::monostate",
+    "string": "std::string",
+    "http://www.w3.org/2001/XMLSchema#string": "std::string",
+    "int": "int32_t",
+    "http://www.w3.org/2001/XMLSchema#int": "int32_t",
+    "long": "int64_t",
+    "http://www.w3.org/2001/XMLSchema#long": "int64_t",
+    "float": "float",
+    "http://www.w3.org/2001/XMLSchema#float": "float",
+    "double": "double",
+    "http://www.w3.org/2001/XMLSchema#double": "double",
+    "boolean": "bool",
+    "http://www.w3.org/2001/XMLSchema#boolean": "bool",
+    f"{_SALAD_NAMESPACE}Any": "std::any",
+    "PrimitiveType": "std::variant<bool, int32_t, int64_t, float, double, std::string>",
+    f"{_SALAD_NAMESPACE}PrimitiveType": (
+        "std::variant<bool, int32_t, int64_t, float, double, std::string>"
+    ),
+}
+
+
+def q(s: str) -> str:
+    """Put quotes around a string."""
+    return '"' + s + '"'
+
+
+def replaceKeywords(s: str) -> str:
+    """Rename keywords that are reserved in C++."""
+    if s in _RESERVED_WORDS:
         s = s + "_"
     return s
 
 
 def safename(name: str) -> str:
     """Create a C++ safe name."""
-    classname = re.sub("[^a-zA-Z0-9]", "_", name)
+    if name.isascii() and name.isalnum():
+        # nothing to substitute, skip the regex pass
+        return replaceKeywords(name)
+    classname = _UNSAFE_CHARS_RE.sub("_", name)
     return replaceKeywords(classname)
 
 
@@ -92,6 +135,17 @@ def split_field(s: str) -> Tuple[str, str, str]:
 class ClassDefinition:
     """Prototype of a class."""
 
+    __slots__ = (
+        "fullName",
+        "extends",
+        "specializationTypes",
+        "allfields",
+        "fields",
+        "abstract",
+        "namespace",
+        "classname",
+    )
+
     def __init__(self, name: str):
         """Initialize the class definition with a name."""
         self.fullName = name
@@ -114,92 +168,96 @@ class ClassDefinition:
 
     def writeDefinition(self, target: IO[Any], fullInd: str, ind: str) -> None:
         """Write definition of the class."""
-        target.write(f"{fullInd}namespace {self.namespace} {{\n")
-        target.write(f"{fullInd}struct {self.classname}")
+        lines = [f"{fullInd}namespace {self.namespace} {{\n{fullInd}struct {self.classname}"]
         extends = list(map(safename2, self.extends))
         override = ""
         virtual = "virtual "
         if len(self.extends) > 0:
-            target.write(f"\n{fullInd}{ind}: ")
-            target.write(f"\n{fullInd}{ind}, ".join(extends))
+            lines.append(f"\n{fullInd}{ind}: ")
+            lines.append(f"\n{fullInd}{ind}, ".join(extends))
             override = " override"
             virtual = ""
-        target.write(" {\n")
+        lines.append(" {\n")
 
-        for field in self.fields:
-            field.writeDefinition(target, fullInd + ind, ind, self.namespace)
+        lines.extend([field.definition(fullInd + ind, self.namespace) for field in self.fields])
 
         if self.abstract:
-            target.write(f"{fullInd}{ind}virtual ~{self.classname}() = 0;\n")
+            lines.append(f"{fullInd}{ind}virtual ~{self.classname}() = 0;\n")
         else:
-            target.write(f"{fullInd}{ind}{virtual}~{self.classname}(){override} = default;\n")
+            lines.append(f"{fullInd}{ind}{virtual}~{self.classname}(){override} = default;\n")
 
-        target.write(f"{fullInd}{ind}{virtual}auto toYaml() const -> YAML::Node{override};\n")
-        target.write(f"{fullInd}{ind}{virtual}void fromYaml(YAML::Node const& n){override};\n")
-        target.write(f"{fullInd}}};\n")
-        target.write(f"{fullInd}}}\n\n")
+        lines.append(
+            f"""{fullInd}{ind}{virtual}auto toYaml() const -> YAML::Node{override};
+{fullInd}{ind}{virtual}void fromYaml(YAML::Node const& n){override};
+{fullInd}}};
+{fullInd}}}
+
+"""
+        )
+        target.write("".join(lines))
 
     def writeImplDefinition(self, target: IO[str], fullInd: str, ind: str) -> None:
         """Write definition with implementation."""
         extends = list(map(safename2, self.extends))
+        lines: List[str] = []
 
         # Declaring default destructor
         if self.abstract:
-            target.write(
+            lines.append(
                 f"{fullInd}inline {self.namespace}::{self.classname}::~{self.classname}() = default;\n"
             )
 
         # Write toYaml function
-        target.write(
+        lines.append(
             f"""{fullInd}inline auto {self.namespace}::{self.classname}::toYaml() const -> YAML::Node {{
 {fullInd}{ind}using ::toYaml;
 {fullInd}{ind}auto n = YAML::Node{{}};
 """
         )
         for e in extends:
-            target.write(f"{fullInd}{ind}n = mergeYaml(n, {e}::toYaml());\n")
+            lines.append(f"{fullInd}{ind}n = mergeYaml(n, {e}::toYaml());\n")
 
         for field in self.fields:
             fieldname = safename(field.name)
             if field.remap != "":
-                target.write(
+                lines.append(
                     f"""{fullInd}{ind}addYamlField(n, {q(field.name)},
 {fullInd}{ind}{ind}convertListToMap(toYaml(*{fieldname}), {q(field.remap)}));\n"""
                 )
             else:
-                target.write(
+                lines.append(
                     f"{fullInd}{ind}addYamlField(n, {q(field.name)}, toYaml(*{fieldname}));\n"
                 )
 
-        target.write(f"{fullInd}{ind}return n;\n{fullInd}}}\n")
+        lines.append(f"{fullInd}{ind}return n;\n{fullInd}}}\n")
 
         # Write fromYaml function
         functionname = f"{self.namespace}::{self.classname}::fromYaml"
-        target.write(
+        lines.append(
             f"""{fullInd}inline void {functionname}([[maybe_unused]] YAML::Node const& n) {{
 {fullInd}{ind}using ::fromYaml;
 """
         )
         for e in extends:
-            target.write(f"{fullInd}{ind}{e}::fromYaml(n);\n")
+            lines.append(f"{fullInd}{ind}{e}::fromYaml(n);\n")
 
         for field in self.fields:
             fieldname = safename(field.name)
             if field.remap != "":
-                target.write(
+                lines.append(
                     f"""
                     {fullInd}{ind}fromYaml(convertMapToList(n[{q(field.name)}],
 {q(field.remap)}), *{fieldname});\n"""
                 )
             else:
-                target.write(f"{fullInd}{ind}fromYaml(n[{q(field.name)}], *{fieldname});\n")
+                lines.append(f"{fullInd}{ind}fromYaml(n[{q(field.name)}], *{fieldname});\n")
 
-        target.write(f"{fullInd}}}\n")
+        lines.append(f"{fullInd}}}\n")
 
         # write type detection function
         if not self.abstract:
             e = f"{self.namespace}::{self.classname}"
-            target.write(
+            lines.append(
                 f"""
 template <>
 struct DetectAndExtractFromYaml<{e}> {{
@@ -211,7 +269,7 @@ struct DetectAndExtractFromYaml<{e}> {{
             )
             for field in self.fields:
                 fieldname = safename(field.name)
-                target.write(
+                lines.append(
                     f"""
         if constexpr (IsConstant<decltype(res.{fieldname})::value_t>::value) try {{
             fromYaml(n[{q(field.name)}], *res.{fieldname});
@@ -220,18 +278,26 @@ struct DetectAndExtractFromYaml<{e}> {{
         }} catch(...) {{}}
 """
                 )
-            target.write(
+            lines.append(
                 """
         return std::nullopt;
     }
 };
 """
             )
+        target.write("".join(lines))
 
 
 class FieldDefinition:
     """Prototype of a single field from a class definition."""
 
+    __slots__ = (
+        "name",
+        "typeStr",
+        "optional",
+        "remap",
+    )
+
     def __init__(self, name: str, typeStr: str, optional: bool, remap: str):
         """Initialize field definition.
 
@@ -243,16 +309,22 @@ class FieldDefinition:
         self.optional = optional
         self.remap = remap
 
-    def writeDefinition(self, target: IO[Any], fullInd: str, ind: str, namespace: str) -> None:
-        """Write a C++ definition for the class field."""
+    def definition(self, fullInd: str, namespace: str) -> str:
+        """Return the C++ definition for the class field."""
         name = safename(self.name)
         typeStr = self.typeStr.replace(namespace + "::", "")
-        target.write(f"{fullInd}heap_object<{typeStr}> {name};\n")
+        return f"{fullInd}heap_object<{typeStr}> {name};\n"
 
 
 class MapDefinition:
     """Prototype of a map."""
 
+    __slots__ = (
+        "values",
+        "namespace",
+        "classname",
+    )
+
     def __init__(self, name: str, values: List[str]):
         """Initialize union definition with a name and possible values."""
         self.values = values
@@ -269,17 +341,23 @@ class MapDefinition:
 
     def writeDefinition(self, target: IO[str], ind: str) -> None:
         """Write map definition to output."""
-        target.write(f"namespace {self.namespace} {{\n")
         if len(self.values) == 1:
             valueType = self._remove_namespace(self.values[0])
         else:
-            valueType = f"std::variant<{', '.join(self._remove_namespace(v) for v in self.values)}>"
-        target.write(f"struct {self.classname} {{\n")
-        target.write(f"{ind}heap_object<std::map<std::string, {valueType}>> value;\n")
-        target.write(f"{ind}auto toYaml() const -> YAML::Node;\n")
-        target.write(f"{ind}void fromYaml(YAML::Node const& n);\n")
-        target.write("};\n")
-        target.write("}\n\n")
+            valueType = (
+                f"std::variant<{', '.join([self._remove_namespace(v) for v in self.values])}>"
+            )
+        target.write(
+            f"""namespace {self.namespace} {{
+struct {self.classname} {{
+{ind}heap_object<std::map<std::string, {valueType}>> value;
+{ind}auto toYaml() const -> YAML::Node;
+{ind}void fromYaml(YAML::Node const& n);
+}};
+}}
+
+"""
+        )
 
     def writeImplDefinition(self, target: IO[str], fullInd: str, ind: str) -> None:
         """Write definition with implementation."""
@@ -305,6 +383,12 @@ class MapDefinition:
 class UnionDefinition:
     """Prototype of a union."""
 
+    __slots__ = (
+        "namespace",
+        "classname",
+        "types",
+    )
+
     def __init__(self, name: str, types: List[str]):
         """Initialize union definition with a name and possible types."""
         (self.namespace, self.classname) = split_name(name)
@@ -313,7 +397,7 @@ class UnionDefinition:
         self.types = (
             self._remove_namespace(types[0])
             if len(types) == 1
-            else f"std::variant<{', '.join(self._remove_namespace(t) for t in types)}>"
+            else f"std::variant<{', '.join([self._remove_namespace(t) for t in types])}>"
         )
 
     def _remove_namespace(self, typeStr: str) -> str:
@@ -325,15 +409,19 @@ class UnionDefinition:
 
     def writeDefinition(self, target: IO[str], ind: str) -> None:
         """Write union definition to output."""
-        target.write(f"namespace {self.namespace} {{\n")
-        target.write(f"struct {self.classname} {{\n")
-        target.write(f"{ind}{self.types} *value = nullptr;\n")
-        target.write(f"{ind}{self.classname}();\n")
-        target.write(f"{ind}~{self.classname}();\n")
-        target.write(f"{ind}auto toYaml() const -> YAML::Node;\n")
-        target.write(f"{ind}void fromYaml(YAML::Node const& n);\n")
-        target.write("};\n")
-        target.write("}\n\n")
+        target.write(
+            f"""namespace {self.namespace} {{
+struct {self.classname} {{
+{ind}{self.types} *value = nullptr;
+{ind}{self.classname}();
+{ind}~{self.classname}();
+{ind}auto toYaml() const -> YAML::Node;
+{ind}void fromYaml(YAML::Node const& n);
+}};
+}}
+
+"""
+        )
 
     def writeImplDefinition(self, target: IO[str], fullInd: str, ind: str) -> None:
         """Write definition with implementation."""
@@ -379,6 +467,11 @@ class UnionDefinition:
 class EnumDefinition:
     """Prototype of a enum."""
 
+    __slots__ = (
+        "name",
+        "values",
+    )
+
     def __init__(self, name: str, values: List[str]):
         """Initialize enum definition with a name and possible values."""
         self.name = name
@@ -395,43 +488,64 @@ class EnumDefinition:
         else:
             name = safename(self.name)
             classname = name
+        enum_values = f",\n{ind}".join(map(safename, self.values))
+        enum_strings = f'",\n{ind}    "'.join(self.values)
+        lines: List[str] = []
         if len(namespace) > 0:
-            target.write(f"namespace {namespace} {{\n")
-        target.write(f"enum class {classname} : unsigned int {{\n{ind}")
-        target.write(f",\n{ind}".join(map(safename, self.values)))
-        target.write("\n};\n")
-        target.write(f"inline auto to_string({classname} v) {{\n")
-        target.write(f"{ind}static auto m = std::vector<std::string_view> {{\n")
-        target.write(f'{ind}    "')
-        target.write(f'",\n{ind}    "'.join(self.values))
-        target.write(f'"\n{ind}}};\n')
-
-        target.write(f"{ind}using U = std::underlying_type_t<{name}>;\n")
-        target.write(f"{ind}return m.at(static_cast<U>(v));\n}}\n")
+            lines.append(f"namespace {namespace} {{\n")
+        lines.append(
+            f"""enum class {classname} : unsigned int {{
+{ind}{enum_values}
+}};
+inline auto to_string({classname} v) {{
+{ind}static auto m = std::vector<std::string_view> {{
+{ind}    "{enum_strings}"
+{ind}}};
+{ind}using U = std::underlying_type_t<{name}>;
+{ind}return m.at(static_cast<U>(v));
+}}
+"""
+        )
 
         if len(namespace) > 0:
-            target.write("}\n")
+            lines.append("}\n")
 
-        target.write(f"inline void to_enum(std::string_view v, {name}& out) {{\n")
-        target.write(f"{ind}static auto m = std::map<std::string, {name}, std::less<>> {{\n")
-        for v in self.values:
-            target.write(f"""{ind}{ind}{{{q(v)}, {name}::{safename(v)}}},\n""")
-        target.write(f"{ind}}};\n{ind}auto iter = m.find(v);\n")
-        target.write(f"{ind}if (iter == m.end()) throw bool{{}};\n")
-        target.write(f"{ind}out = iter->second;\n}}\n")
+        lines.append(
+            f"""inline void to_enum(std::string_view v, {name}& out) {{
+{ind}static auto m = std::map<std::string, {name}, std::less<>> {{
+"""
+        )
+        lines.extend([f"""{ind}{ind}{{{q(v)}, {name}::{safename(v)}}},\n""" for v in self.values])
+        lines.append(
+            f"""{ind}}};
+{ind}auto iter = m.find(v);
+{ind}if (iter == m.end()) throw bool{{}};
+{ind}out = iter->second;
+}}
+"""
+        )
 
         # Write toYaml function
-        target.write(f"inline auto toYaml({name} v) {{\n")
-        target.write(f"{ind}return YAML::Node{{std::string{{to_string(v)}}}};\n}}\n")
+        lines.append(
+            f"""inline auto toYaml({name} v) {{
+{ind}return YAML::Node{{std::string{{to_string(v)}}}};
+}}
+"""
+        )
 
         # Write fromYaml function
-        target.write(f"inline void fromYaml(YAML::Node n, {name}& out) {{\n")
-        target.write(f"{ind}to_enum(n.as<std::string>(), out);\n}}\n")
+        lines.append(
+            f"""inline void fromYaml(YAML::Node n, {name}& out) {{
+{ind}to_enum(n.as<std::string>(), out);
+}}
+"""
+        )
 
         if len(self.values):
-            target.write(f"template <> struct IsConstant<{name}> : std::true_type {{}};\n")
+            lines.append(f"template <> struct IsConstant<{name}> : std::true_type {{}};\n")
 
-        target.write("\n")
+        lines.append("\n")
+        target.write("".join(lines))
 
 
 # !TODO way tot many functions, most of these shouldn't exists
@@ -439,7 +553,7 @@ def isPrimitiveType(v: Any) -> bool:
     """Check if v is a primitve type."""
     if not isinstance(v, str):
         return False
-    return v in ["null", "boolean", "int", "long", "float", "double", "string"]
+    return v in _PRIMITIVE_TYPE_NAMES
 
 
 def hasFieldValue(e: Any, f: str, v: Any) -> bool:
@@ -448,7 +562,11 @@ def hasFieldValue(e: Any, f: str, v: Any) -> bool:
         return False
     if f not in e:
         return False
-    return bool(e[f] in [v, f"https://w3id.org/cwl/salad#{v}"])
+    spellings = _TYPE_NAME_SPELLINGS.get(v)
+    if spellings is None:
+        return bool(e[f] in [v, f"{_SALAD_NAMESPACE}{v}"])
+    value = e[f]
+    return isinstance(value, str) and value in spellings
 
 
 def isRecordSchema(v: Any) -> bool:
@@ -559,42 +677,8 @@ class CppCodeGen(CodeGenBase):
             return self.convertTypeToCpp([type_declaration])
 
         if len(type_declaration) == 1:
-            if type_declaration[0] in ("null", "https://w3id.org/cwl/salad#null"):
-                return "std::monostate"
-            elif type_declaration[0] in (
-                "string",
-                "http://www.w3.org/2001/XMLSchema#string",
-            ):
-                return "std::string"
-            elif type_declaration[0] in ("int", "http://www.w3.org/2001/XMLSchema#int"):
-                return "int32_t"
-            elif type_declaration[0] in (
-                "long",
-                "http://www.w3.org/2001/XMLSchema#long",
-            ):
-                return "int64_t"
-            elif type_declaration[0] in (
-                "float",
-                "http://www.w3.org/2001/XMLSchema#float",
-            ):
-                return "float"
-            elif type_declaration[0] in (
-                "double",
-                "http://www.w3.org/2001/XMLSchema#double",
-            ):
-                return "double"
-            elif type_declaration[0] in (
-                "boolean",
-                "http://www.w3.org/2001/XMLSchema#boolean",
-            ):
-                return "bool"
-            elif type_declaration[0] == "https://w3id.org/cwl/salad#Any":
-                return "std::any"
-            elif type_declaration[0] in (
-                "PrimitiveType",
-                "https://w3id.org/cwl/salad#PrimitiveType",
-            ):
-                return "std::variant<bool, int32_t, int64_t, float, double, std::string>"
+            if isinstance(type_declaration[0], str) and type_declaration[0] in _PRIMITIVE_TYPES:
+                return _PRIMITIVE_TYPES[type_declaration[0]]
             elif isinstance(type_declaration[0], dict):
                 if "type" in type_declaration[0] and type_declaration[0]["type"] in (
                     "enum",
@@ -10,6 +10,8 @@ from .cpp_codegen import isArray, isEnumSchema, isRecordSchema, pred
 from .exceptions import SchemaException
 from .schema import shortname
 
+_RESERVED_WORDS = frozenset({"class", "abstract", "default", "package"})
+
 
 class DlangCodeGen(CodeGenBase):
     """Generation of D code for a given Schema Salad definition."""
@@ -129,7 +131,7 @@ unittest
     def safe_name(name: str) -> str:
         """Generate a safe version of the given name."""
         avn = schema.avro_field_name(name)
-        if avn in ("class", "abstract", "default", "package"):
+        if avn in _RESERVED_WORDS:
             # reserved words
             avn = avn + "_"
         if avn and avn.startswith("anon."):
@@ -143,14 +145,19 @@ unittest
         if isinstance(doc, str):
             lines = doc.split("\n")
         else:
-            lines = sum((d.split("\n") for d in doc), [])
+            lines = []
+            for d in doc:
+                lines.extend(d.split("\n"))
 
         if not lines[-1]:
             lines = lines[0:-1]
 
-        lines = [line.replace("`(`", "`$(LPAREN)`").replace("`)`", "`$(RPAREN)`") for line in lines]
-
-        doc_lines = "\n".join(f" * {line}" for line in lines)
+        doc_lines = "\n".join(
+            [
+                " * " + line.replace("`(`", "`$(LPAREN)`").replace("`)`", "`$(RPAREN)`")
+                for line in lines
+            ]
+        )
 
         return f"""/**
 {doc_lines}
@@ -246,7 +253,7 @@ unittest
         if "fields" in stype:
             for field in stype["fields"]:
                 field_decls.append(self.parse_record_field(field, classname))
-        decl_str = "\n".join(textwrap.indent(f"{d}", " " * 4) for d in field_decls)
+        decl_str = "\n".join([textwrap.indent(f"{d}", " " * 4) for d in field_decls])
 
         if stype.get("documentRoot", False):
             doc_root_annotation = "@documentRoot "
@@ -276,10 +283,10 @@ unittest
 
         classname = self.safe_name(name)
         syms = "\n".join(
-            (
+            [
                 f'        s{i} = "{shortname(sym)}", ///'  # noqa: B907
                 for i, sym in enumerate(stype["symbols"])
-            )
+            ]
         )
 
         if stype.get("documentRoot", False):
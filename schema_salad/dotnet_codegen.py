@@ -24,6 +24,19 @@ from .java_codegen import _ensure_directory_and_write, _safe_makedirs
 from .schema import shortname
 from .utils import Traversable, files
 
+_RESERVED_WORDS = frozenset(
+    {
+        "class",
+        "in",
+        "extends",
+        "abstract",
+        "default",
+        "package",
+        "arguments",
+        "out",
+    }
+)
+
 
 def doc_to_doc_string(doc: Optional[str], indent_level: int = 0) -> str:
     """Generate a documentation string from a schema salad doc field."""
@@ -134,16 +147,7 @@ class DotNetCodeGen(CodeGenBase):
         avn = schema.avro_field_name(name)
         if avn.startswith("anon."):
             avn = avn[5:]
-        if avn in (
-            "class",
-            "in",
-            "extends",
-            "abstract",
-            "default",
-            "package",
-            "arguments",
-            "out",
-        ):
+        if avn in _RESERVED_WORDS:
             # reserved words
             avn = avn + "_"
 
@@ -173,6 +177,7 @@ class DotNetCodeGen(CodeGenBase):
         self.current_constructor_body = StringIO()
         self.current_loader = StringIO()
         self.current_serializer = StringIO()
+        self.current_class_fields = StringIO()
         self.current_fieldtypes: Dict[str, TypeDef] = {}
         self.optional_field_names: List[str] = []
         self.mandatory_field_names: List[str] = []
@@ -191,7 +196,7 @@ class DotNetCodeGen(CodeGenBase):
         with open(self.current_interface_target_file, "w") as f:
             _logger.info("Writing file: %s", self.current_interface_target_file)
             if extends:
-                ext = " : " + ", ".join("I" + self.safe_name(e) for e in extends)
+                ext = " : " + ", ".join(["I" + self.safe_name(e) for e in extends])
             else:
                 ext = ""
             f.write(
@@ -339,7 +344,7 @@ public class {cls} : {current_interface}, ISaveable
         if len(self.mandatory_field_names) > 0:
             self.current_loader.write(
                 ",\n          "
-                + ",\n          ".join(f + ": " + f for f in self.mandatory_field_names)
+                + ",\n          ".join([f + ": " + f for f in self.mandatory_field_names])
             )
         self.current_loader.write("\n        );\n")
 
@@ -378,6 +383,7 @@ public class {cls} : {current_interface}, ISaveable
             self.current_class_target_file,
             "a",
         ) as f:
+            f.write(self.current_class_fields.getvalue())
             f.write(self.current_constructor_signature.getvalue())
             f.write(self.current_constructor_body.getvalue())
             f.write(self.current_loader.getvalue())
@@ -486,7 +492,7 @@ public class {cls} : {current_interface}, ISaveable
                     LazyInitDef(
                         loader_name,
                         "((UnionLoader){}).addLoaders(new List<ILoader> {{ {} }});".format(
-                            loader_name, ", ".join(s.name for s in sub_types)
+                            loader_name, ", ".join([s.name for s in sub_types])
                         ),
                     )
                 )
@@ -629,24 +635,23 @@ public class {enum_name} : IEnumClass<{enum_name}>
             self.mandatory_field_names.append(safename)
             optionalstring = ""
 
-        with open(self.current_class_target_file, "a") as f:
-            if doc:
-                f.write(
-                    """
+        if doc:
+            self.current_class_fields.write(
+                """
     /// <summary>
 {doc_str}
     /// </summary>
 """.format(
-                        doc_str=doc_to_doc_string(doc, indent_level=1)
-                    )
-                )
-            f.write(
-                "    public {type}{optionalstring} {safename} {{ get; set; }}\n".format(
-                    safename=safename,
-                    type=fieldtype.instance_type,
-                    optionalstring=optionalstring,
+                    doc_str=doc_to_doc_string(doc, indent_level=1)
                 )
             )
+        self.current_class_fields.write(
+            "    public {type}{optionalstring} {safename} {{ get; set; }}\n".format(
+                safename=safename,
+                type=fieldtype.instance_type,
+                optionalstring=optionalstring,
+            )
+        )
         if fieldname == "class":
             if fieldtype.instance_type == "string":
                 self.current_constructor_signature_optionals.write(
@@ -939,10 +944,10 @@ public class {enum_name} : IEnumClass<{enum_name}>
             self.target_dir / self.package / "Properties" / "AssemblyInfo.cs",
         )
         vocab = ",\n        ".join(
-            f"""["{k}"] = "{self.vocab[k]}\"""" for k in sorted(self.vocab.keys())  # noqa: B907
+            [f"""["{k}"] = "{self.vocab[k]}\"""" for k in sorted(self.vocab.keys())]  # noqa: B907
         )
         rvocab = ",\n        ".join(
-            f"""["{self.vocab[k]}"] = "{k}\"""" for k in sorted(self.vocab.keys())  # noqa: B907
+            [f"""["{self.vocab[k]}"] = "{k}\"""" for k in sorted(self.vocab.keys())]  # noqa: B907
         )
 
         loader_instances = ""
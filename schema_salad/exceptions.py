@@ -34,14 +34,14 @@ class SchemaSaladException(Exception):
                 exc.bullet = bullet
             return exc
 
-        if children is None:
-            self.children: List["SchemaSaladException"] = []
-        elif len(children) <= 1:
-            self.children = sum((simplify(c) for c in children), [])
-        else:
-            self.children = sum(
-                (simplify(with_bullet(c, bullet_for_children)) for c in children), []
-            )
+        self.children: List["SchemaSaladException"] = []
+        if children is not None:
+            if len(children) <= 1:
+                for c in children:
+                    self.children.extend(simplify(c))
+            else:
+                for c in children:
+                    self.children.extend(simplify(with_bullet(c, bullet_for_children)))
 
         self.with_sourceline(sl)
         self.propagate_sourceline()
@@ -74,11 +74,15 @@ class SchemaSaladException(Exception):
         return self
 
     def leaves(self) -> List["SchemaSaladException"]:
-        if len(self.children) > 0:
-            return sum((c.leaves() for c in self.children), [])
-        if len(self.message):
-            return [self]
-        return []
+        leaves: List["SchemaSaladException"] = []
+        stack: List["SchemaSaladException"] = [self]
+        while stack:
+            exc = stack.pop()
+            if len(exc.children) > 0:
+                stack.extend(reversed(exc.children))
+            elif len(exc.message):
+                leaves.append(exc)
+        return leaves
 
     def prefix(self) -> str:
         pre: str = ""
@@ -102,15 +106,30 @@ class SchemaSaladException(Exception):
         return str(self.pretty_str())
 
     def pretty_str(self, level: int = 0) -> str:
-        messages = len(self.message)
-        my_summary = [self.summary(level, True)] if messages else []
-        next_level = level + 1 if messages else level
-
-        ret = "\n".join(e for e in my_summary + [c.pretty_str(next_level) for c in self.children])
+        lines: List[str] = []
+        self.write_pretty_lines(lines, level)
+        ret = "\n".join(lines)
         if level == 0:
             return strip_duplicated_lineno(reflow_all(ret))
         return ret
 
+    def write_pretty_lines(self, lines: List[str], level: int = 0) -> None:
+        """Append the lines of :py:meth:`pretty_str` to a shared buffer, without reflowing."""
+        if len(self.message):
+            lines.append(self.summary(level, True))
+            next_level = level + 1
+        elif not self.children:
+            lines.append("")
+            return
+        else:
+            next_level = level
+        for c in self.children:
+            if next_level == 0:
+                # children rendered at the top level are reflowed on their own
+                lines.append(c.pretty_str(0))
+            else:
+                c.write_pretty_lines(lines, next_level)
+
 
 class SchemaException(SchemaSaladException):
     """Indicates error with the provided schema definition."""
@@ -125,4 +144,4 @@ class ClassValidationException(ValidationException):
 
 
 def to_one_line_messages(exc: SchemaSaladException) -> str:
-    return "\n".join(c.summary() for c in exc.leaves())
+    return "\n".join([c.summary() for c in exc.leaves()])
@@ -31,6 +31,8 @@ USE_ONE_OR_LIST_OF_TYPES = False
 
 BASIC_JAVA_IDENTIFIER_RE = re.compile(r"[^0-9a-zA-Z]+")
 
+_RESERVED_WORDS = frozenset({"class", "extends", "abstract", "default", "package"})
+
 
 def _ensure_directory_and_write(path: Path, contents: str) -> None:
     _safe_makedirs(path.parent)
@@ -162,7 +164,7 @@ class JavaCodeGen(CodeGenBase):
     @staticmethod
     def safe_name(name: str) -> str:
         avn = JavaCodeGen.property_name(name)
-        if avn in ("class", "extends", "abstract", "default", "package"):
+        if avn in _RESERVED_WORDS:
             # reserved words
             avn = avn + "_"
         if avn and avn.startswith("anon."):
@@ -188,6 +190,7 @@ class JavaCodeGen(CodeGenBase):
         self.current_loader = StringIO()
         self.current_fieldtypes: Dict[str, TypeDef] = {}
         self.current_fields = StringIO()
+        self.current_interface_fields = StringIO()
         interface_doc_str = f"* Auto-generated interface for <I>{classname}</I><BR>"
         if not abstract:
             implemented_by = "This interface is implemented by {{@link {}Impl}}<BR>"
@@ -199,7 +202,9 @@ class JavaCodeGen(CodeGenBase):
         with open(target, "w") as f:
             _logger.info("Writing file: %s", target)
             if extends:
-                ext = "extends " + ", ".join(self.interface_name(e) for e in extends) + ", Saveable"
+                ext = (
+                    "extends " + ", ".join([self.interface_name(e) for e in extends]) + ", Saveable"
+                )
             else:
                 ext = "extends Saveable"
             f.write(
@@ -334,6 +339,7 @@ public class {cls}Impl extends SaveableImpl implements {cls} {{
     def end_class(self, classname: str, field_names: List[str]) -> None:
         """Finish this class."""
         with open(self.main_src_dir / f"{self.current_class}.java", "a") as f:
+            f.write(self.current_interface_fields.getvalue())
             f.write(
                 """
 }
@@ -431,9 +437,9 @@ public class {cls}Impl extends SaveableImpl implements {cls} {{
                 TypeDef(
                     instance_type="Object",
                     init="new UnionLoader(new Loader[] {{ {} }})".format(
-                        ", ".join(s.name for s in sub)
+                        ", ".join([s.name for s in sub])
                     ),
-                    name="union_of_{}".format("_or_".join(s.name for s in sub)),
+                    name="union_of_{}".format("_or_".join([s.name for s in sub])),
                     loader_type="Loader<Object>",
                 )
             )
@@ -564,7 +570,7 @@ public class {cls}Impl extends SaveableImpl implements {cls} {{
                     LazyInitDef(
                         loader_name,
                         "((UnionLoader) {}).addLoaders(new Loader[] {{ {} }});".format(
-                            loader_name, ", ".join(s.name for s in sub)
+                            loader_name, ", ".join([s.name for s in sub])
                         ),
                     )
                 )
@@ -588,7 +594,7 @@ public class {cls}Impl extends SaveableImpl implements {cls} {{
         for sym in symbols:
             self.add_vocab(shortname(sym), sym)
         clazz = self.safe_name(type_declaration["name"])
-        symbols_decl = 'new String[] {{"{}"}}'.format('", "'.join(sym for sym in symbols))
+        symbols_decl = 'new String[] {{"{}"}}'.format('", "'.join(symbols))
         enum_path = self.main_src_dir / f"{clazz}.java"
         with open(enum_path, "w") as f:
             _logger.info("Writing file: %s", enum_path)
@@ -684,17 +690,15 @@ public enum {clazz} {{
 """.format(
             fieldname=fieldname, field_doc_str=doc_to_doc_string(doc, indent_level=1)
         )
-        target = self.main_src_dir / f"{self.current_class}.java"
-        with open(target, "a") as f:
-            f.write(
-                """
+        self.current_interface_fields.write(
+            """
 {getter_doc_str}
   {type} get{capfieldname}();""".format(
-                    getter_doc_str=getter_doc_str,
-                    capfieldname=cap_case_property_name,
-                    type=fieldtype.instance_type,
-                )
+                getter_doc_str=getter_doc_str,
+                capfieldname=cap_case_property_name,
+                type=fieldtype.instance_type,
             )
+        )
 
         if self.current_class_is_abstract:
             return
@@ -938,7 +942,7 @@ public enum {clazz} {{
             for example_name in os.listdir(self.examples):
                 if example_name.startswith("valid"):
                     basename = os.path.basename(example_name).rsplit(".", 1)[0]
-                    basename = re.sub(BASIC_JAVA_IDENTIFIER_RE, "_", basename)
+                    basename = BASIC_JAVA_IDENTIFIER_RE.sub("_", basename)
                     example_tests += """
   @org.junit.Test
   public void test{basename}ByString() throws Exception {{
@@ -43,6 +43,15 @@ PluginName = Literal[
 
 _logger = logging.getLogger("salad")
 
+# Pattern inspired from 'mistune.block_parser.BlockParser.FENCED_CODE'.
+# However, instead of the initial ' {0,3}' part to match any indented fenced-code,
+# use any quantity of spaces, as long as they match at the end as well (using '\1').
+# Because of nested fenced-code in lists, it can be more indented than "normal".
+_FENCED_CODE_RE = re.compile(r"( *)(`{3,}|~{3,})([^`\n]*)\n(?:|([\s\S]*?)\n)(?:\1\2[~`]* *\n+|$)")
+_HEADING_RE = re.compile(r"^(#+) (.*)")
+_BARE_URL_RE = re.compile(r"^(https?://\S+)")
+_EMAIL_RE = re.compile(r"<([^>@]+@[^>]+)>")
+
 
 def escape_html(s: str) -> str:
     """Escape HTML but otherwise preserve single quotes."""
@@ -116,15 +125,8 @@ class MyRenderer(HTMLRenderer):
 
 def patch_fenced_code(original_markdown_text: str, modified_markdown_text: str) -> str:
     """Reverts fenced code fragments found in the modified contents back to their original definition."""
-    # Pattern inspired from 'mistune.block_parser.BlockParser.FENCED_CODE'.
-    # However, instead of the initial ' {0,3}' part to match any indented fenced-code,
-    # use any quantity of spaces, as long as they match at the end as well (using '\1').
-    # Because of nested fenced-code in lists, it can be more indented than "normal".
-    fenced_code_pattern = re.compile(
-        r"( *)(`{3,}|~{3,})([^`\n]*)\n(?:|([\s\S]*?)\n)(?:\1\2[~`]* *\n+|$)"
-    )
-    matches_original = list(re.finditer(fenced_code_pattern, original_markdown_text))
-    matches_modified = list(re.finditer(fenced_code_pattern, modified_markdown_text))
+    matches_original = list(_FENCED_CODE_RE.finditer(original_markdown_text))
+    matches_modified = list(_FENCED_CODE_RE.finditer(modified_markdown_text))
     if len(matches_original) != len(matches_modified):
         raise ValueError("Cannot patch fenced code definitions with inconsistent matches.")
     result = ""
@@ -221,7 +223,7 @@ def number_headings(toc: ToC, maindoc: str) -> str:
             skip = not skip
 
         if not skip:
-            m = re.match(r"^(#+) (.*)", line)
+            m = _HEADING_RE.match(line)
             if m is not None:
                 group1 = m.group(1)
                 assert group1 is not None  # nosec
@@ -229,7 +231,7 @@ def number_headings(toc: ToC, maindoc: str) -> str:
                 assert group2 is not None  # nosec
                 num = toc.add_entry(len(group1), group2)
                 line = f"{group1} {num} {group2}"
-            line = re.sub(r"^(https?://\S+)", r"[\1](\1)", line)
+            line = _BARE_URL_RE.sub(r"[\1](\1)", line)
         mdlines.append(line)
 
     maindoc = "\n".join(mdlines)
@@ -238,9 +240,7 @@ def number_headings(toc: ToC, maindoc: str) -> str:
 
 def fix_doc(doc: Union[List[str], str]) -> str:
     docstr = "".join(doc) if isinstance(doc, MutableSequence) else doc
-    return "\n".join(
-        [re.sub(r"<([^>@]+@[^>]+)>", r"[\1](mailto:\1)", d) for d in docstr.splitlines()]
-    )
+    return "\n".join([_EMAIL_RE.sub(r"[\1](mailto:\1)", d) for d in docstr.splitlines()])
 
 
 class RenderType:
@@ -262,6 +262,22 @@ class RenderType:
         self.title: Optional[str] = None
         self.primitiveType = primitiveType
 
+        plugins: List[PluginName] = [
+            "strikethrough",
+            "footnotes",
+            "table",
+            "url",
+        ]
+        # if escape active, wraps literal HTML into '<p> {HTML} </p>'
+        # we must pass it to both since 'MyRenderer' is predefined
+        escape = False
+        # the renderer holds no per-document state, so it is built once and reused
+        self.markdown2html: Markdown = create_markdown(
+            renderer=MyRenderer(escape=escape),
+            plugins=plugins,
+            escape=escape,
+        )
+
         for t in j:
             if "extends" in t:
                 for e in aslist(t["extends"]):
@@ -460,25 +476,13 @@ class RenderType:
             f["doc"] = number_headings(self.toc, f["doc"])
 
         doc = doc + "\n\n" + f["doc"]
-        plugins: List[PluginName] = [
-            "strikethrough",
-            "footnotes",
-            "table",
-            "url",
-        ]
-        # if escape active, wraps literal HTML into '<p> {HTML} </p>'
-        # we must pass it to both since 'MyRenderer' is predefined
-        escape = False
-        markdown2html: Markdown = create_markdown(
-            renderer=MyRenderer(escape=escape),
-            plugins=plugins,
-            escape=escape,
-        )
-        doc = cast(str, markdown2html(doc))
+        markdown2html = self.markdown2html
+        doc_parts = [cast(str, markdown2html(doc))]
 
         if f["type"] == "record":
-            doc += "<h3>Fields</h3>"
-            doc += """
+            doc_parts.append("<h3>Fields</h3>")
+            doc_parts.append(
+                """
 <div class="responsive-table">
 <div class="row responsive-table-header">
 <div class="col-xs-3 col-lg-2">field</div>
@@ -486,6 +490,7 @@ class RenderType:
 <div class="col-xs-7 col-lg-3">type</div>
 <div class="col-xs-12 col-lg-6 description-header">description</div>
 </div>"""
+            )
             required = []
             optional = []
             for i in f.get("fields", []):
@@ -515,23 +520,23 @@ class RenderType:
                     required.append(tr)
                 else:
                     optional.append(tr)
-            for i in required + optional:
-                doc += i
-            doc += """</div>"""
+            doc_parts.extend(required)
+            doc_parts.extend(optional)
+            doc_parts.append("""</div>""")
         elif f["type"] == "enum":
-            doc += "<h3>Symbols</h3>"
-            doc += """<table class="table table-striped">"""
-            doc += "<tr><th>symbol</th><th>description</th></tr>"
+            doc_parts.append("<h3>Symbols</h3>")
+            doc_parts.append("""<table class="table table-striped">""")
+            doc_parts.append("<tr><th>symbol</th><th>description</th></tr>")
             for e in ex:
                 for i in e.get("symbols", []):
-                    doc += "<tr>"
                     efrg = avro_field_name(i)
-                    doc += "<td><code>{}</code></td><td>{}</td>".format(
-                        efrg, enumDesc.get(efrg, "")
+                    doc_parts.append(
+                        "<tr><td><code>{}</code></td><td>{}</td></tr>".format(
+                            efrg, enumDesc.get(efrg, "")
+                        )
                     )
-                    doc += "</tr>"
-            doc += """</table>"""
-        f["doc"] = doc
+            doc_parts.append("""</table>""")
+        f["doc"] = "".join(doc_parts)
 
         self.typedoc.write(f["doc"])
 
@@ -25,6 +25,8 @@ from .exceptions import SchemaException
 from .schema import shortname
 from .utils import files
 
+_RESERVED_WORDS = frozenset({"class", "in", "type"})
+
 _string_type_def = TypeDef("strtype", "_PrimitiveLoader(str)")
 _int_type_def = TypeDef("inttype", "_PrimitiveLoader(int)")
 _float_type_def = TypeDef("floattype", "_PrimitiveLoader(float)")
@@ -101,7 +103,7 @@ class PythonCodeGen(CodeGenBase):
             avn = avn[5:]
         elif avn[0].isdigit():
             avn = f"_{avn}"
-        elif avn in ("class", "in", "type"):
+        elif avn in _RESERVED_WORDS:
             # reserved words
             avn = f"{avn}_"
         return avn.replace(".", "_")
@@ -155,7 +157,7 @@ class PythonCodeGen(CodeGenBase):
         classname = self.safe_name(classname)
 
         if extends:
-            ext = ", ".join(self.safe_name(e) for e in extends)
+            ext = ", ".join([self.safe_name(e) for e in extends])
         else:
             ext = "Saveable"
 
@@ -458,7 +460,7 @@ if _errors__:
                         self.safe_name(type_declaration["name"]) + "Loader",
                         '_EnumLoader(("{}",), "{}"){}'.format(
                             '", "'.join(
-                                schema.avro_field_name(sym) for sym in type_declaration["symbols"]
+                                [schema.avro_field_name(sym) for sym in type_declaration["symbols"]]
                             ),
                             self.safe_name(type_declaration["name"]),
                             docstring,
@@ -86,7 +86,7 @@ def to_validation_exception(e: MarkedYAMLError) -> ValidationException:
 
     exc = ValidationException(e.problem)
     mark = e.problem_mark
-    exc.file = re.sub(fname_regex, "", mark.name)
+    exc.file = fname_regex.sub("", mark.name)
     exc.start = (mark.line + 1, mark.column + 1)
     exc.end = None
 
@@ -94,7 +94,7 @@ def to_validation_exception(e: MarkedYAMLError) -> ValidationException:
         parent = ValidationException(e.context)
         context_mark = e.context_mark
         if context_mark:
-            parent.file = re.sub(fname_regex, "", context_mark.name)
+            parent.file = fname_regex.sub("", context_mark.name)
             parent.start = (context_mark.line + 1, context_mark.column + 1)
         parent.end = None
         parent.children = [exc]
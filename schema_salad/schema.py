@@ -2,6 +2,7 @@
 
 import copy
 import hashlib
+from functools import lru_cache
 from typing import (
     IO,
     Any,
@@ -504,6 +505,14 @@ def replace_type(
     return items
 
 
+@lru_cache(maxsize=4096)
+def _avro_field_name(url: str) -> str:
+    d = urlparse(url)
+    if d.fragment:
+        return d.fragment.split("/")[-1]
+    return d.path.split("/")[-1]
+
+
 def avro_field_name(url: str) -> str:
     """
     Turn a URL into an Avro-safe name.
@@ -513,10 +522,7 @@ def avro_field_name(url: str) -> str:
     Extract either the last part of the URL fragment past the slash, otherwise
     the whole fragment.
     """
-    d = urlparse(url)
-    if d.fragment:
-        return d.fragment.split("/")[-1]
-    return d.path.split("/")[-1]
+    return _avro_field_name(url)
 
 
 Avro = TypeVar("Avro", MutableMapping[str, Any], MutableSequence[Any], str)
@@ -758,7 +764,10 @@ def make_avro_schema(
     """
     names = Names()
     avro = make_avro(i, loader, metaschema_vocab)
-    make_avsc_object(convert_to_dict(avro), names)
+    # No convert_to_dict() needed: extend_and_specialize() rebuilds its input
+    # with deepcopy_strip(), so make_avro() only ever sees (and returns) plain
+    # dicts and lists; make_valid_avro() merely shallow-copies those.
+    make_avsc_object(avro, names)
     return names
 
 
@@ -768,14 +777,19 @@ def make_avro_schema_from_avro(avro: List[Union[Avro, Dict[str, str], str]]) ->
     return names
 
 
-def shortname(inputid: str) -> str:
-    """Return the last segment of the provided fragment or path."""
+@lru_cache(maxsize=4096)
+def _shortname(inputid: str) -> str:
     parsed_id = urlparse(inputid)
     if parsed_id.fragment:
         return parsed_id.fragment.split("/")[-1]
     return parsed_id.path.split("/")[-1]
 
 
+def shortname(inputid: str) -> str:
+    """Return the last segment of the provided fragment or path."""
+    return _shortname(inputid)
+
+
 def print_inheritance(doc: List[Dict[str, Any]], stream: IO[Any]) -> None:
     """Write a Grapviz inheritance graph for the supplied document."""
     stream.write("digraph {\n")
@@ -785,7 +799,7 @@ def print_inheritance(doc: List[Dict[str, Any]], stream: IO[Any]) -> None:
             fields = entry.get("fields", [])
             if fields:
                 label += "\\n* {}\\l".format(
-                    "\\l* ".join(shortname(field["name"]) for field in fields)
+                    "\\l* ".join([shortname(field["name"]) for field in fields])
                 )
             shape = "ellipse" if entry.get("abstract") else "box"
             stream.write(f'"{name}" [shape={shape} label="{label}"];\n')  # noqa: B907
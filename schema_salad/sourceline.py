@@ -99,7 +99,7 @@ def indent(v: str, nolead: bool = False, shift: str = "  ", bullet: str = "  ")
 def bullets(textlist: List[str], bul: str) -> str:
     if len(textlist) == 1:
         return textlist[0]
-    return "\n".join(indent(t, bullet=bul) for t in textlist)
+    return "\n".join([indent(t, bullet=bul) for t in textlist])
 
 
 def strip_duplicated_lineno(text: str) -> str:
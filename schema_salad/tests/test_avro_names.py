@@ -2,6 +2,7 @@
 
 from schema_salad.avro.schema import Names
 from schema_salad.schema import load_schema
+from schema_salad.validate import _avro_type_name, avro_type_name
 
 from .util import get_data
 
@@ -13,3 +14,16 @@ def test_avro_loading() -> None:
     document_loader, avsc_names, schema_metadata, metaschema_loader = load_schema(path)
     assert isinstance(avsc_names, Names)
     assert avsc_names.get_name("com.example.derived_schema.ExtendedThing", None)
+
+
+def test_avro_type_name_cache() -> None:
+    """Repeated avro_type_name lookups, primitives included, hit the cache."""
+    _avro_type_name.cache_clear()
+    url = "https://w3id.org/cwl/cwl#CommandLineTool/inputs"
+    assert avro_type_name(url) == "org.w3id.cwl.cwl.CommandLineTool.inputs"
+    assert avro_type_name(url) == "org.w3id.cwl.cwl.CommandLineTool.inputs"
+    primitive = "http://www.w3.org/2001/XMLSchema#string"
+    assert avro_type_name(primitive) == "string"
+    assert avro_type_name(primitive) == "string"
+    info = _avro_type_name.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
@@ -29,3 +29,46 @@ def test_extend_and_specialize_enums(tmp_path: Path) -> None:
     ]
     for symbol in symbols:
         assert symbol in CWLType["symbols"]
+
+
+def test_avro_field_name_cache() -> None:
+    """Repeated lookups of the same URL are served from the cache."""
+    schema._avro_field_name.cache_clear()
+    url = "https://w3id.org/cwl/cwl#CommandLineTool/inputs"
+    assert schema.avro_field_name(url) == "inputs"
+    assert schema.avro_field_name(url) == "inputs"
+    assert schema._avro_field_name.cache_info().hits == 1
+    assert schema.avro_field_name("https://example.com/path/name") == "name"
+    assert schema.avro_field_name("name") == "name"
+    info = schema._avro_field_name.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_shortname_cache() -> None:
+    """Repeated lookups of the same URL are served from the cache."""
+    schema._shortname.cache_clear()
+    url = "https://w3id.org/cwl/cwl#CommandLineTool/inputs"
+    assert schema.shortname(url) == "inputs"
+    assert schema.shortname(url) == "inputs"
+    info = schema._shortname.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_make_avro_returns_builtin_containers() -> None:
+    """make_avro_schema relies on make_avro output being plain dicts and lists."""
+    document_loader, _, _, metaschema_loader = schema.load_schema(cwl_file_uri)
+    schema_raw_doc = metaschema_loader.fetch(cwl_file_uri)
+    schema_doc, _ = metaschema_loader.resolve_all(schema_raw_doc, cwl_file_uri)
+    avro = schema.make_avro(cast(List[Dict[str, Any]], schema_doc), document_loader)
+
+    def check(item: Any) -> None:
+        if isinstance(item, dict):
+            assert type(item) is dict
+            for v in item.values():
+                check(v)
+        elif isinstance(item, list):
+            assert type(item) is list
+            for v in item:
+                check(v)
+
+    check(avro)
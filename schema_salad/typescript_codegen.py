@@ -23,6 +23,18 @@ from .java_codegen import _ensure_directory_and_write, _safe_makedirs
 from .schema import shortname
 from .utils import Traversable, files
 
+_RESERVED_WORDS = frozenset(
+    {
+        "class",
+        "in",
+        "extends",
+        "abstract",
+        "default",
+        "package",
+        "arguments",
+    }
+)
+
 
 def doc_to_doc_string(doc: Optional[str], indent_level: int = 0) -> str:
     """Generate a documentation string from a schema salad doc field."""
@@ -115,15 +127,7 @@ class TypeScriptCodeGen(CodeGenBase):
         avn = schema.avro_field_name(name)
         if avn.startswith("anon."):
             avn = avn[5:]
-        if avn in (
-            "class",
-            "in",
-            "extends",
-            "abstract",
-            "default",
-            "package",
-            "arguments",
-        ):
+        if avn in _RESERVED_WORDS:
             # reserved words
             avn = avn + "_"
 
@@ -152,6 +156,8 @@ class TypeScriptCodeGen(CodeGenBase):
         self.current_constructor_body = StringIO()
         self.current_loader = StringIO()
         self.current_serializer = StringIO()
+        self.current_interface_fields = StringIO()
+        self.current_class_fields = StringIO()
         self.current_fieldtypes: Dict[str, TypeDef] = {}
         self.idfield = idfield
 
@@ -171,7 +177,7 @@ class TypeScriptCodeGen(CodeGenBase):
             _logger.info("Writing file: %s", self.current_interface_target_file)
             if extends:
                 ext = "extends Internal." + ", Internal.".join(
-                    self.safe_name(e) + "Properties" for e in extends
+                    [self.safe_name(e) + "Properties" for e in extends]
                 )
             else:
                 ext = ""
@@ -280,6 +286,7 @@ export class {cls} extends Saveable implements Internal.{current_interface} {{
     def end_class(self, classname: str, field_names: List[str]) -> None:
         """Signal that we are done with this class."""
         with open(self.current_interface_target_file, "a") as f:
+            f.write(self.current_interface_fields.getvalue())
             f.write("}")
         if self.current_class_is_abstract:
             return
@@ -319,7 +326,7 @@ export class {cls} extends Saveable implements Internal.{current_interface} {{
             )
         )
         self.current_loader.write(
-            ",\n      ".join(self.safe_name(f) + ": " + self.safe_name(f) for f in field_names)
+            ",\n      ".join([self.safe_name(f) + ": " + self.safe_name(f) for f in field_names])
             + "\n    })"
         )
         self.current_loader.write(
@@ -346,6 +353,7 @@ export class {cls} extends Saveable implements Internal.{current_interface} {{
             self.current_class_target_file,
             "a",
         ) as f:
+            f.write(self.current_class_fields.getvalue())
             f.write(self.current_constructor_signature.getvalue())
             f.write(self.current_constructor_body.getvalue())
             f.write(self.current_loader.getvalue())
@@ -450,7 +458,7 @@ export class {cls} extends Saveable implements Internal.{current_interface} {{
                     LazyInitDef(
                         loader_name,
                         "{}.addLoaders([{}]);".format(
-                            loader_name, ", ".join(s.name for s in sub_types)
+                            loader_name, ", ".join([s.name for s in sub_types])
                         ),
                     )
                 )
@@ -521,54 +529,52 @@ export enum {enum_name} {{
         else:
             optionalstring = ""
 
-        with open(self.current_interface_target_file, "a") as f:
-            if doc:
-                f.write(
-                    """
+        if doc:
+            self.current_interface_fields.write(
+                """
   /**
 {doc_str}
    */
 """.format(
-                        doc_str=doc_to_doc_string(doc, indent_level=1)
-                    )
+                    doc_str=doc_to_doc_string(doc, indent_level=1)
                 )
-            if fieldname == "class":
-                f.write(
-                    "  {safename}{optionalstring}: {type}\n".format(
-                        safename=safename,
-                        type=fieldtype.instance_type,
-                        optionalstring="?",
-                    )
+            )
+        if fieldname == "class":
+            self.current_interface_fields.write(
+                "  {safename}{optionalstring}: {type}\n".format(
+                    safename=safename,
+                    type=fieldtype.instance_type,
+                    optionalstring="?",
                 )
-            else:
-                f.write(
-                    "  {safename}{optionalstring}: {type}\n".format(
-                        safename=safename,
-                        type=fieldtype.instance_type,
-                        optionalstring=optionalstring,
-                    )
+            )
+        else:
+            self.current_interface_fields.write(
+                "  {safename}{optionalstring}: {type}\n".format(
+                    safename=safename,
+                    type=fieldtype.instance_type,
+                    optionalstring=optionalstring,
                 )
+            )
         if self.current_class_is_abstract:
             return
 
-        with open(self.current_class_target_file, "a") as f:
-            if doc:
-                f.write(
-                    """
+        if doc:
+            self.current_class_fields.write(
+                """
   /**
 {doc_str}
    */
 """.format(
-                        doc_str=doc_to_doc_string(doc, indent_level=1)
-                    )
-                )
-            f.write(
-                "  {safename}{optionalstring}: {type}\n".format(
-                    safename=safename,
-                    type=fieldtype.instance_type,
-                    optionalstring=optionalstring,
+                    doc_str=doc_to_doc_string(doc, indent_level=1)
                 )
             )
+        self.current_class_fields.write(
+            "  {safename}{optionalstring}: {type}\n".format(
+                safename=safename,
+                type=fieldtype.instance_type,
+                optionalstring=optionalstring,
+            )
+        )
         if fieldname == "class":
             if fieldtype.instance_type == "string":
                 self.current_constructor_signature.write(
@@ -800,10 +806,10 @@ export enum {enum_name} {{
         expand_resource_template_to("index.ts", self.main_src_dir / "index.ts")
 
         vocab = ",\n  ".join(
-            f"""'{k}': '{self.vocab[k]}'""" for k in sorted(self.vocab.keys())  # noqa: B907
+            [f"""'{k}': '{self.vocab[k]}'""" for k in sorted(self.vocab.keys())]  # noqa: B907
         )
         rvocab = ",\n  ".join(
-            f"""'{self.vocab[k]}': '{k}'""" for k in sorted(self.vocab.keys())  # noqa: B907
+            [f"""'{self.vocab[k]}': '{k}'""" for k in sorted(self.vocab.keys())]  # noqa: B907
         )
 
         loader_instances = ""
@@ -814,7 +820,7 @@ export enum {enum_name} {{
                 )
 
         sorted_modules = sorted(self.modules)
-        internal_module_exports = "\n".join(f"export * from '../{f}'" for f in sorted_modules)
+        internal_module_exports = "\n".join([f"export * from '../{f}'" for f in sorted_modules])
 
         if self.lazy_inits:
             loader_instances += "\n"
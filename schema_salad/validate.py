@@ -1,5 +1,6 @@
 import logging
 import pprint
+from functools import lru_cache
 from typing import Any, List, Mapping, MutableMapping, MutableSequence, Optional, Set
 from urllib.parse import urlsplit
 
@@ -66,15 +67,8 @@ primitives = {
 }
 
 
-def avro_type_name(url: str) -> str:
-    """
-    Turn a URL into an Avro-safe name.
-
-    If the URL has no fragment, return this plain URL.
-
-    Extract either the last part of the URL fragment past the slash, otherwise
-    the whole fragment.
-    """
+@lru_cache(maxsize=4096)
+def _avro_type_name(url: str) -> str:
     global primitives
 
     if url in primitives:
@@ -88,6 +82,18 @@ def avro_type_name(url: str) -> str:
     return ".".join(joined)
 
 
+def avro_type_name(url: str) -> str:
+    """
+    Turn a URL into an Avro-safe name.
+
+    If the URL has no fragment, return this plain URL.
+
+    Extract either the last part of the URL fragment past the slash, otherwise
+    the whole fragment.
+    """
+    return _avro_type_name(url)
+
+
 def friendly(v: Any) -> Any:
     """Format an Avro schema into a pretty-printed representation."""
     if isinstance(v, avro.schema.NamedSchema):
@@ -421,7 +427,7 @@ def validate_ex(
                         err = ValidationException(
                             "invalid field {!r}, expected one of: {}".format(
                                 d,
-                                ", ".join(f"{fn.name!r}" for fn in expected_schema.fields),
+                                ", ".join([f"{fn.name!r}" for fn in expected_schema.fields]),
                             ),
                             sl,
                         )